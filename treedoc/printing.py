@@ -6,6 +6,7 @@ Module for printers (classes) and associated functions.
 
 import abc
 import collections
+import functools
 import importlib
 import inspect
 import os
@@ -15,7 +16,7 @@ import sys
 import textwrap
 import typing
 
-from treedoc.utils import Peekable, PrintMixin
+from treedoc.utils import Peekable, PrintMixin, cache_by_id
 
 # =============================================================================
 # ------------------------ PART 1/2 OF MODULE - CLASSES -----------------------
@@ -37,7 +38,7 @@ class PrinterABC(abc.ABC):
         ----------
         iterator : Iterator
             An iterator yielding (print_stack, stack).
-            The stacks are lists representing paths in the object tree.
+            The stacks are sequences representing paths in the object tree.
 
         Yields
         ------
@@ -345,6 +346,11 @@ def describe(obj) -> str:
     return _describe(obj).ljust(17)
 
 
+def _doc_attribute(obj):
+    """The `__doc__` of an object. Cached docstrings are recomputed if it is reassigned."""
+    return getattr(obj, "__doc__", None)
+
+
 def get_docstring(obj, *, width=88) -> str:
     """Get a docstring summary from an object.
 
@@ -357,16 +363,19 @@ def get_docstring(obj, *, width=88) -> str:
     >>> get_docstring(set.intersection, width=18)
     'Return the...'
     """
+    return _get_docstring(obj, width=width)
+
+
+@cache_by_id(depends_on=_doc_attribute)
+def _get_docstring(obj, *, width) -> str:
+    """Compute the docstring summary returned by `get_docstring`."""
 
     # =============================================================================
     #     TODO: This function needs to become smarter, i.e. more adaptible to
     #     how docstrings are written "in the wild".
     # =============================================================================
 
-    # pydoc.getdoc is slightly more general than inspect.getdoc,see:
-    # https://github.com/python/cpython/blob/master/Lib/pydoc.py#L92
-    doc = pydoc.getdoc(obj)
-    first_line, rest = pydoc.splitdoc(doc)
+    doc, first_line, rest = _split_docstring(obj)
 
     # Could not get a single synopsis. Can we get the first two sentences?
     if (not first_line) and rest and ("\n\n" in rest):
@@ -388,6 +397,19 @@ def get_docstring(obj, *, width=88) -> str:
     return ""
 
 
+@cache_by_id(depends_on=_doc_attribute)
+def _split_docstring(obj) -> typing.Tuple[str, str, str]:
+    """Return (doc, first_line, rest) of an object, cached for every object.
+
+    Shared by `get_docstring` and `signature_from_docstring`, so that the docstring
+    of an object is looked up once."""
+    # pydoc.getdoc is slightly more general than inspect.getdoc,see:
+    # https://github.com/python/cpython/blob/master/Lib/pydoc.py#L92
+    doc = pydoc.getdoc(obj)
+    first_line, rest = pydoc.splitdoc(doc)
+    return doc, first_line, rest
+
+
 def clean_object_stack(stack):
     """
     Join an object stack so that consecutive modules are merged into the last one.
@@ -404,9 +426,8 @@ def clean_object_stack(stack):
     >>> clean_object_stack(input_stack) == input_stack
     True
     """
-    assert isinstance(stack, list)
+    assert isinstance(stack, (list, tuple))
 
-    stack = stack.copy()
     new_stack = []
 
     for obj in stack:
@@ -417,7 +438,6 @@ def clean_object_stack(stack):
             new_stack.pop()
         new_stack.append(obj)
 
-    assert len(new_stack) > 0
     return new_stack
 
 
@@ -439,11 +459,13 @@ def _between(string, start, end) -> str:
     Traceback (most recent call last):
         ...
     ValueError: substring not found
+    >>> _between("pop(k[,d])", "[", "]")
+    ',d'
     """
-    i = string.index(start)
-    part = string[i + len(start) :]
-    j = part.index(")")
-    return part[:j]
+    _, found, part = string.partition(start)
+    if not found:
+        raise ValueError("substring not found")
+    return part[: part.index(end)]
 
 
 def signature_from_docstring(obj):
@@ -459,8 +481,9 @@ def signature_from_docstring(obj):
     True
     """
 
-    # If not docstring is available, return
-    docstring_line = get_docstring(obj)
+    # If not docstring is available, return. The signature is on the first line
+    doc, _, _ = _split_docstring(obj)
+    docstring_line = doc.partition("\n")[0]
 
     if not docstring_line:
         return None
@@ -470,13 +493,12 @@ def signature_from_docstring(obj):
         return None
 
     # Look for the name of the object, i.e. func(x)
-    assert hasattr(obj, "__name__")
-
-    if not obj.__name__ in docstring_line:
+    name = getattr(obj, "__name__", None)
+    if name is None or name not in docstring_line:
         return None
 
     # Attempt to get the signature
-    index = docstring_line.index(obj.__name__) + len(obj.__name__)
+    index = docstring_line.index(name) + len(name)
     signature_part = docstring_line[index:]
 
     try:
@@ -546,7 +568,7 @@ def _format_signature(obj, *, verbosity=2) -> str:
 
     # Check if object has signature
     try:
-        sig = inspect.signature(obj)
+        sig, params, annotated, has_defaults = _signature_info(obj)
     except ValueError:
         # inspect.signature raises ValueError if no signature can be provided.
         # Example:
@@ -588,10 +610,6 @@ def _format_signature(obj, *, verbosity=2) -> str:
     if str(sig) == "()" and verbosity > 0:
         return str(sig)
 
-    # Check if signature has annotations or defaults
-    annotated = any(param.annotation is not param.empty for param in sig.parameters.values())
-    has_defaults = any(param.default is not param.empty for param in sig.parameters.values())
-
     # Dial down verbosity if user has provided a more verbose alternative than is available
     if not annotated:
         max_verbosity = 3
@@ -610,13 +628,13 @@ def _format_signature(obj, *, verbosity=2) -> str:
         return "(...)"
 
     elif verbosity == 2:
-        return_sig = SEP.join(_get_name(param) for param in sig.parameters.values())
+        return_sig = SEP.join(_get_name(param) for param in params)
         return "(" + return_sig + ")"
 
     elif verbosity == 3:
         return_sig = SEP.join(
             param.name + "=" + str(param.default) if param.default is not param.empty else _get_name(param)
-            for param in sig.parameters.values()
+            for param in params
         )
         return "(" + return_sig + ")"
 
@@ -624,6 +642,29 @@ def _format_signature(obj, *, verbosity=2) -> str:
         return str(sig)
 
 
+@cache_by_id()
+def _signature_info(obj) -> tuple:
+    """Return (signature, parameters, annotated, has_defaults) for an object.
+
+    The parameters are a tuple, and the booleans tell whether any parameter has an
+    annotation or a default value. Raises like `inspect.signature`, failures are not
+    cached."""
+    sig = inspect.signature(obj)
+    params = tuple(sig.parameters.values())
+
+    # A single pass over the parameters, stopping once both answers are known
+    annotated = has_defaults = False
+    for param in params:
+        if param.annotation is not param.empty:
+            annotated = True
+        if param.default is not param.empty:
+            has_defaults = True
+        if annotated and has_defaults:
+            break
+
+    return sig, params, annotated, has_defaults
+
+
 def resolve_str_to_obj(object_string: str) -> object:
     """
     Resolve a string to a Python object.
@@ -647,14 +688,12 @@ def resolve_str_to_obj(object_string: str) -> object:
         ...
     ModuleNotFoundError: No module named 'gibberish'
     """
-    assert isinstance(object_string, str)
-
     # Case 1: Some jokster passed the string "None", so we return None back
     if object_string == "None":
         return None
 
     # Case 2: The object string is "collections.deque" or some dotted path
-    suggestion = pydoc.locate(object_string)
+    suggestion = _locate(object_string)
     if suggestion is not None:
         return suggestion
 
@@ -692,6 +731,30 @@ def resolve_str_to_obj(object_string: str) -> object:
         raise
 
 
+def _locate(object_string: str) -> object:
+    """Version of `pydoc.locate` caching successful lookups.
+
+    Failed lookups (None) are not cached, so an object created or made importable
+    later is still found. Names in `__main__` are never cached, since the script
+    run as `__main__` may change between calls. A path to a file is not looked up
+    here, and is passed to `pydoc.importfile` on every call in `resolve_str_to_obj`."""
+    if object_string == "__main__" or object_string.startswith("__main__."):
+        return pydoc.locate(object_string)
+    try:
+        return _locate_found(object_string)
+    except LookupError:
+        return None
+
+
+@functools.lru_cache(maxsize=1024)
+def _locate_found(object_string: str) -> object:
+    """Cached `pydoc.locate`, raising LookupError on failure so it is not cached."""
+    located = pydoc.locate(object_string)
+    if located is None:
+        raise LookupError(object_string)
+    return located
+
+
 def resolve_input(obj):
     """Resolve a general input (str, iterable, etc) to a list of Python objects.
 
@@ -0,0 +1,19 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Apr 21 21:13:23 2019
+
+@author: tommy
+"""
+
+import operator
+
+
+def func_addition(a, b):
+    """Permforms addition."""
+    return operator.add(a, b)
+
+
+def _hidden_func_addition(a, b):
+    """Permforms addition."""
+    return operator.add(a, b)
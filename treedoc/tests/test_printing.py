@@ -10,6 +10,8 @@ import datetime
 import itertools
 import math
 import operator
+import sys
+import types
 from collections.abc import Callable
 
 import pytest
@@ -330,6 +332,17 @@ class TestObjectResolution:
         with pytest.raises(ImportError):
             resolve_str_to_obj("gibberish")
 
+    @staticmethod
+    def test_resolve_str_to_obj_failure_not_cached(monkeypatch):
+        """A failed lookup is retried, finding an attribute defined later."""
+        module = types.ModuleType("treedoc_late_module")
+        monkeypatch.setitem(sys.modules, "treedoc_late_module", module)
+        with pytest.raises(ImportError):
+            resolve_str_to_obj("treedoc_late_module.func")
+
+        module.func = len
+        assert resolve_str_to_obj("treedoc_late_module.func") is len
+
     @staticmethod
     def test_resolve_str_to_obj_from_file():
         """Test that object resolution works on files."""
@@ -12,7 +12,17 @@ import pytest
 
 import treedoctestpackage as testpackage
 import treedoctestpackage.subpackage as subtestpackage
-from treedoc.traversal import ObjectTraverser, descend_from_package, is_package
+from treedoc.traversal import (
+    ObjectTraverser,
+    descend_from_package,
+    get_members,
+    is_dunder_method,
+    is_inspectable,
+    is_package,
+    is_private,
+    is_propersubpackage,
+    is_subpackage,
+)
 from treedoctestpackage import module
 
 
@@ -129,6 +139,30 @@ class TestObjectTraverser:
         traverser = ObjectTraverser(subpackages=True, modules=modules)
         assert not traverser.recurse_to_child_object(obj=treedoctestpackage, child_obj=func_subtraction)
 
+    @staticmethod
+    @pytest.mark.parametrize("modules", [True, False])
+    def test_recursion_subpackages_from_bytecode(modules):
+        """Packages are recognized by their spec, also when loaded from '__init__.pyc'."""
+        import importlib.machinery
+        import os
+        import types
+
+        def make_package(name, package, *path):
+            mod = types.ModuleType(name)
+            mod.__file__ = os.path.join(os.sep, "site", *path, "__init__.pyc")
+            mod.__package__ = package
+            mod.__spec__ = importlib.machinery.ModuleSpec(name, None, is_package=True)
+            return mod
+
+        pkg = make_package("pkg", "pkg", "pkg")
+        sub = make_package("pkg.sub", "pkg.sub", "pkg", "sub")
+
+        traverser = ObjectTraverser(subpackages=True, modules=modules)
+        assert traverser.recurse_to_child_object(obj=pkg, child_obj=sub)
+
+        traverser = ObjectTraverser(subpackages=False, modules=modules)
+        assert not traverser.recurse_to_child_object(obj=pkg, child_obj=sub)
+
     @staticmethod
     @pytest.mark.parametrize("subpackages, modules", itertools.product([True, False], [True, False]))
     def test_recursion_composite_classes(subpackages, modules):
@@ -143,6 +177,66 @@ class TestObjectTraverser:
 
         assert not traverser.recurse_to_child_object(obj=Car, child_obj=Wheel)
 
+    @staticmethod
+    def test_search_yields_snapshots():
+        """The search yields tuples, which remain valid after the search moves on."""
+        from treedoctestpackage import module2
+
+        traverser = ObjectTraverser()
+        results = list(traverser.search(module2))
+
+        assert len(results) > 1
+        for stack, final_node_at_depth in results:
+            assert isinstance(stack, tuple) and isinstance(final_node_at_depth, tuple)
+            assert len(stack) == len(final_node_at_depth)
+            assert stack[0] is module2
+
+        # The final child of the root is marked as such
+        assert results[-1][1] == (True, True)
+
+    @staticmethod
+    @pytest.mark.parametrize("level", [1, 999])
+    def test_search_classes_listed_in_defining_module(level):
+        """A class seen through another module is still listed in its own module,
+        even if the other module is visited first, or is below the level limit."""
+        import email
+        import email.charset
+        import email.errors
+
+        # `email.charset` imports the module `email.errors`, and comes before it
+        assert email.charset.errors is email.errors
+
+        traverser = ObjectTraverser(modules=True, level=level)
+        parents = [stack[-2] for (stack, _) in traverser.search(email) if stack[-1] is email.errors.BoundaryError]
+        assert email.errors in parents
+
+    @staticmethod
+    def test_flags_changed_after_construction():
+        """The public flags are read during the search, not frozen at construction."""
+        import collections
+
+        traverser = ObjectTraverser()
+        found = [stack[-1].__name__ for (stack, _) in traverser.search(collections.Counter)]
+        assert "__add__" not in found
+
+        traverser.dunders = True
+        found = [stack[-1].__name__ for (stack, _) in traverser.search(collections.Counter)]
+        assert "__add__" in found
+
+    @staticmethod
+    def test_search_names_only_kept_objects():
+        """Objects without a `__name__` are only given one if they are kept."""
+        import functools
+
+        class Shapes:
+            square = functools.partial(pow, exp=2)
+            _cube = functools.partial(pow, exp=3)
+
+        found = [stack[-1] for (stack, _) in ObjectTraverser().search(Shapes)]
+
+        assert Shapes.square in found and Shapes.square.__name__ == "square"
+        assert Shapes._cube not in found and not hasattr(Shapes._cube, "__name__")
+
 
 def map_itemgetter(iterable, index: int):
     """Map an itemgetter over an iterable, returning element correpoding to index."""
@@ -169,6 +263,124 @@ def test_is_package():
     assert not is_package(subpackagemodule)
 
 
+def test_is_package_from_spec():
+    """Packages are recognized by their spec, even without an '__init__.py' file."""
+    import importlib.machinery
+    import types
+
+    namespace = types.ModuleType("namespace")
+    namespace.__spec__ = importlib.machinery.ModuleSpec("namespace", None, is_package=True)
+    assert is_package(namespace)
+
+    compiled = types.ModuleType("compiled")
+    compiled.__file__ = "compiled/__init__.pyc"
+    compiled.__spec__ = importlib.machinery.ModuleSpec("compiled", None, is_package=True)
+    assert is_package(compiled)
+
+    # Without a spec, the file name decides
+    assert not is_package(types.ModuleType("no_spec"))
+    no_spec = types.ModuleType("no_spec")
+    no_spec.__file__ = "no_spec/__init__.py"
+    assert is_package(no_spec)
+
+
+def test_is_subpackage_respects_path_separators():
+    import os
+    import types
+
+    def make_module(name, *path):
+        mod = types.ModuleType(name)
+        mod.__file__ = os.path.join(os.sep, "site", *path, "__init__.py")
+        return mod
+
+    pkg = make_module("pkg", "pkg")
+    pkg_sub = make_module("pkg.sub", "pkg", "sub")
+    pkgother = make_module("pkgother", "pkgother")
+
+    assert is_subpackage(pkg_sub, pkg) and is_propersubpackage(pkg_sub, pkg)
+    assert is_subpackage(pkg, pkg) and not is_propersubpackage(pkg, pkg)
+    assert not is_subpackage(pkgother, pkg)
+
+
+def test_is_inspectable():
+    import functools
+
+    assert is_inspectable(module)
+    assert is_inspectable(module.MyClass)
+    assert is_inspectable(functools.partial(max, 1))
+    assert not is_inspectable(42)
+
+    # Unhashable objects, such as a module `__spec__`, must not raise TypeError
+    assert not is_inspectable([1, 2, 3])
+    assert not is_inspectable(module.__spec__)
+
+
+@pytest.mark.parametrize(
+    "name, dunder, private",
+    [("__add__", True, False), ("__", False, False), ("_", False, True), ("_norm", False, True), ("add", False, False)],
+)
+def test_is_dunder_method_and_is_private(name, dunder, private):
+    def func():
+        pass
+
+    func.__name__ = name
+    assert is_dunder_method(func) == dunder
+    assert is_private(func) == private
+
+
+def test_is_dunder_method_and_is_private_without_name():
+    assert not is_dunder_method(42)
+    assert not is_private(42)
+
+
+def test_get_members():
+    """Private and dunder names are filtered on the attribute name, before getattr."""
+
+    class Vector:
+        def add(self, other):
+            pass
+
+        def _norm(self):
+            pass
+
+        @property
+        def length(self):
+            raise AttributeError("Never accessed")
+
+    names = [name for (name, _) in get_members(Vector)]
+    assert names == ["add", "length"]
+
+    names = [name for (name, _) in get_members(Vector, include_private=True, ignored_names={"length"})]
+    assert names == ["_norm", "add"]
+
+    names = [name for (name, _) in get_members(Vector, include_dunders=True)]
+    assert "__init__" in names and "_norm" not in names
+
+    # An object attribute raising AttributeError is skipped, like inspect.getmembers
+    names = [name for (name, _) in get_members(Vector())]
+    assert names == ["add"]
+
+
+@pytest.mark.parametrize("enum_class", ["Color", "Flag"])
+def test_get_members_dynamic_class_attributes(enum_class):
+    """Like `inspect.getmembers`, the `DynamicClassAttribute` names of the bases are
+    yielded, even though getting them from the class raises AttributeError."""
+    import enum
+
+    class Color(enum.Enum):
+        RED = 1
+        GREEN = 2
+
+    cls = {"Color": Color, "Flag": enum.Flag}[enum_class]
+
+    names = [name for (name, _) in get_members(cls)]
+    assert "name" in names and "value" in names
+
+    # The same public members as `inspect.getmembers`
+    expected = [name for (name, _) in inspect.getmembers(cls) if not name.startswith("_")]
+    assert names == expected
+
+
 class TestDescendFromPackage:
     @staticmethod
     def test_package_to_subpackages():
@@ -4,6 +4,63 @@
 Tests for classes and functions located in `utils.py`.
 """
 
+import pytest
+
+from treedoc.utils import Peekable, PrintMixin
+
+
+def test_peekable_with_none_items():
+    """A peeked `None` is an item, not a missing lookahead."""
+    p = Peekable([None, 1])
+
+    assert p.peek() is None
+    assert p.peek() is None
+    assert next(p) is None
+    assert p
+    assert list(p) == [1]
+    assert not p
+
+    with pytest.raises(StopIteration):
+        p.peek()
+
+
+def test_printmixin_repr():
+    class Point(PrintMixin):
+        def __init__(self, x, label):
+            self.x = x
+            self.label = label
+            self._cache = {}
+
+    assert repr(Point(1, "origin")) == "Point(x=1, label='origin', _cache={})"
+
+
+def test_printmixin_repr_with_slots():
+    class Point(PrintMixin):
+        __slots__ = ("x", "y", "_z")
+
+        def __init__(self, x, y):
+            self.x = x
+            self.y = y
+            self._z = 0
+
+    class LabeledPoint(Point):
+        __slots__ = ("label", "__dict__")
+
+        def __init__(self, x, y, label):
+            super().__init__(x, y)
+            self.label = label
+            self.color = "red"
+
+    # The mixin adds no `__dict__`, so slot-only subclasses stay slot-only
+    assert not hasattr(Point(1, 2), "__dict__")
+    assert repr(Point(1, 2)) == "Point(x=1, y=2, _z=0)"
+    assert repr(LabeledPoint(1, 2, "origin")) == "LabeledPoint(color='red', x=1, y=2, _z=0, label='origin')"
+
+    # Slots that are not set are left out
+    point = Point(1, 2)
+    del point.y
+    assert repr(point) == "Point(x=1, _z=0)"
+
 
 if __name__ == "__main__":
     import pytest
@@ -16,20 +16,34 @@ TODO: Description.
 
 
 """
+import collections
 import functools
 import importlib
 import inspect
 import itertools
+import logging
 import os
 import pkgutil
 import sys
+import types
 
-from treedoc.utils import PrintMixin
+from treedoc.utils import INSPECT_PREDICATES, PrintMixin, cache_by_id
 
-# Defining inspection funcs in global scope speeds up treedoc program by ~20%
-_func_names = [func_name for func_name in dir(inspect) if func_name.startswith("is")]
-INSPECTION_FUNCS = [getattr(inspect, func_name) for func_name in _func_names]
-del _func_names
+logger = logging.getLogger(__name__)
+
+# Defining inspection funcs in global scope speeds up treedoc program by ~20%.
+_INSPECT_PREDICATES = tuple(INSPECT_PREDICATES.values())
+
+# The predicates true for most objects in a traversal are tried first, the rest after
+_FAST_INSPECT = (
+    inspect.ismodule,
+    inspect.isclass,
+    inspect.isfunction,
+    inspect.isbuiltin,
+    inspect.ismethod,
+    inspect.ismethoddescriptor,
+)
+_REST_INSPECT = tuple(func for func in _INSPECT_PREDICATES if func not in _FAST_INSPECT)
 
 # =============================================================================
 # ------------------------ PART 1/2 OF MODULE - CLASSES -----------------------
@@ -63,125 +77,114 @@ class ObjectTraverser(PrintMixin):
 
     def search(self, obj):
         """DFS search starting at an object and recursing to its children."""
-        yield from self._search(obj=obj, stack=None)
+        yield from self._search(obj=obj, stack=[], final_node_at_depth=[])
 
-    def _p(self, *args):
-        """Printing/logging method."""
-        return None
-        # TODO: set up proper logging
-        print(*args, file=self.stream)
+    def recurse_to_child_object(self, *, obj, child_obj, context=None) -> bool:
+        """Given an object and its child, do we recurse down to the child?
 
-    def recurse_to_child_object(self, *, obj, child_obj) -> bool:
-        """Given an object and its child, do we recurse down to the child?"""
+        The `context` holds properties of `obj`, see `_parent_context`. It is computed
+        if not given, but may be passed to avoid computing it for every child.
+        """
+        if context is None:
+            context = _parent_context(obj)
 
         # TODO: Optimize this by placing what fails most often first
 
-        self._p(f"obj = {obj.__name__}, child_obj = {child_obj.__name__}")
+        # With neither subpackages nor modules requested, a module never recurses to
+        # another module. Exit before the expensive package and path comparisons below
+        if not (self.subpackages or self.modules) and inspect.ismodule(child_obj) and context.is_module:
+            return False  # Condition 0.1
 
         # =============================================================================
         #  (1) CASE: Parent is a module, and child is not a module
         # =============================================================================
 
-        if inspect.ismodule(obj) and not inspect.ismodule(child_obj):
+        if context.is_module and not inspect.ismodule(child_obj):
+            child_module = _getmodule(child_obj)
+
             # Prevent `collections.eq` / `collections._eq`
             if inspect.isbuiltin(child_obj):
-                if inspect.getmodule(child_obj) != obj:
-                    self._p(f"OC: Failed on condition 1.1")
-                    return False
+                if child_module != obj:
+                    return False  # Condition 1.1
 
             # Not defined in the sub-tree, skip it
-            if not is_subpackage(inspect.getmodule(child_obj), obj):
-                self._p(f"OC: Failed on condition 1.2")
-                return False
+            relation = _package_relation(child_module, obj)
+            if relation == _UNRELATED:
+                return False  # Condition 1.2
 
             # The object is defined in a different file
-            if inspect.getmodule(child_obj) != obj:
+            if child_module != obj:
                 # If the object is not __init__.py,
                 # never include anything imported to it
-                if not is_package(obj):
-                    self._p(f"OC: Failed on condition 1.3")
-                    return False
+                if not context.is_package:
+                    return False  # Condition 1.3
 
                 # At this point the object is __init__.py, and we *might* include
                 # a file imported into it (depending on settings below)
 
                 # The object is defined at a lower level
-                if is_propersubpackage(inspect.getmodule(child_obj), obj):
+                if relation == _PROPER_SUBPACKAGE:
                     if self.subpackages:
                         # will find it later, so skip it now
-                        self._p(f"OC: Failed on condition 1.4")
-                        return False
+                        return False  # Condition 1.4
 
                 # If the object is defined at the same level
-                if is_subpackage(inspect.getmodule(child_obj), obj) and is_subpackage(
-                    obj, inspect.getmodule(child_obj)
-                ):
+                if relation == _SAME_PACKAGE:
                     if self.modules:
                         # will find it later, so skip it now
-                        self._p(f"OC: Failed on condition 1.5")
-                        return False
+                        return False  # Condition 1.5
 
         # =============================================================================
         #  (2) CASE: Both parent and child are modules, i.e. __init__.py or module.py
         # =============================================================================
 
-        if inspect.ismodule(obj) and inspect.ismodule(child_obj):
+        if context.is_module and inspect.ismodule(child_obj):
             # The order is wrong, i.e. `main` in `main.subpackage` implies going up
-            different_packages = child_obj.__package__ != obj.__package__
+            # Packages are compared using dotted prefixes, so `pkg` does not contain `pkgother`
+            child_package = child_obj.__package__
+            different_packages = child_package != context.package
             # pytest.collect has __package__ == None
-            if child_obj.__package__ is None:
+            if child_package is None:
                 child_package_wrong = False
 
             else:
-                child_package_wrong = child_obj.__package__ in obj.__package__  # type: ignore
+                child_package_wrong = context.package_prefix.startswith(_package_prefix(child_package))
 
             if different_packages and child_package_wrong:
-                self._p(f"OC: Failed on condition 2.1")
-                return False
+                return False  # Condition 2.1
 
-            if child_obj.__package__ is not None:
+            if child_package is not None:
                 # Prevents for instance `pandas` to recurse into `numpy`
-                if not obj.__package__ in child_obj.__package__:  # type: ignore
-                    self._p(f"OC: Failed on condition 2.2")
-                    return False
+                if different_packages and not child_package.startswith(context.package_prefix):
+                    return False  # Condition 2.2
+
+            # TODO: Another fail safe to prevent `mysubpackage` to recurse into `subpack`,
+            # using `__path__` of both modules
 
-            # Another fail safe to prevent `mysubpackage` to recurse into `subpack`
-            if hasattr(obj, "__path__") and hasattr(child_obj, "__path__"):
-                # TODO
-                pass
+            # The file is None for built-in modules, e.g. <module 'sys' (built-in)>
+            child_file = _getfile(child_obj)
 
             # Fail safe to prevent recursing from `pkg/file.py` to `pkg/__init__.py`
-            if hasattr(obj, "__file__") and hasattr(child_obj, "__file__"):
-                obj_pth, obj_py_file = os.path.split(inspect.getfile(obj))
-                child_obj_pth, child_obj_py_file = os.path.split(inspect.getfile(child_obj))
-                if not obj_pth in child_obj_pth:
-                    self._p(f"OC: Failed on condition 2.3")
-                    return False
-
-                if inspect.getfile(obj) == inspect.getfile(child_obj):
-                    self._p(f"OC: Failed on condition 2.4")
-                    return False
-
-                if child_obj_py_file == "__init__.py" and obj_py_file != "__init__.py":
-                    self._p(f"OC: Failed on condition 2.5")
-                    return False
-
-            if is_propersubpackage(child_obj, obj) and not self.subpackages:
-                self._p(f"OC: Failed on condition 2.6")
-                return False
-
-            try:
-                file = inspect.getfile(child_obj)
-                if (not file.endswith("__init__.py")) and not self.modules:
-                    self._p(f"OC: Failed on condition 2.7")
-                    return False
-            except TypeError:
-                # TypeError: <module 'sys' (built-in)> is a built-in module
-                pass
-
-            if obj.__package__ == child_obj.__package__ and not self.modules:
-                self._p(f"OC: Failed on condition 2.8")
-                return False
+            if context.file is not None and child_file is not None:
+                obj_pth = context.path
+                child_obj_pth, _ = _splitfile(child_obj)
+                if not (child_obj_pth == obj_pth or _is_proper_subpath(child_obj_pth, obj_pth)):
+                    return False  # Condition 2.3
+
+                if context.file == child_file:
+                    return False  # Condition 2.4
+
+                if is_package(child_obj) and not context.is_package:
+                    return False  # Condition 2.5
+
+            if _package_relation(child_obj, obj) == _PROPER_SUBPACKAGE and not self.subpackages:
+                return False  # Condition 2.6
+
+            if child_file is not None and not is_package(child_obj) and not self.modules:
+                return False  # Condition 2.7
+
+            if context.package == child_obj.__package__ and not self.modules:
+                return False  # Condition 2.8
 
         # =============================================================================
         #  (3) CASE: The child is a class
@@ -190,96 +193,107 @@ class ObjectTraverser(PrintMixin):
         # We're dealing with a class imported from another library, skip it
         # TODO: Extend this to other objects?
         if inspect.isclass(child_obj):
-            if not is_subpackage(inspect.getmodule(child_obj), obj):
-                self._p(f"OC: Failed on condition 3.1")
-                return False
+            if _package_relation(_getmodule(child_obj), obj) == _UNRELATED:
+                return False  # Condition 3.1
 
             if obj in inspect.getmro(child_obj):
-                self._p(f"OC: Failed on condition 3.2")
-                return False
+                return False  # Condition 3.2
 
             # We prefer going from modules to classes, not from classes to classes
-            if inspect.isclass(obj):
-                self._p(f"OC: Failed on condition 3.3")
-                return False
+            if context.is_class:
+                return False  # Condition 3.3
 
         # =============================================================================
         #         if not is_subpackage(inspect.getmodule(child_obj), obj):
-        #             self._p(f"OC: Failed on condition 4.1")
-        #             return False
+        #             return False  # Condition 4.1
         # =============================================================================
 
         return True
 
-    def recurse_to_object(self, obj) -> bool:
-        """Given an object, should we recurse down to it?"""
-
-        name = obj.__name__
+    def recurse_to_object(self, obj, name=None) -> bool:
+        """Given an object, should we recurse down to it?
 
-        # The following order is based on line profiling in an attempt to speed
-        # up recursion
-        # Inline comments original condition -> renamed condition indicate
-        # renaming condition following profiling
+        The `name` defaults to `obj.__name__`, and may be passed by callers that
+        have already looked it up."""
 
-        # 1.5 -> 1.1
-        if is_dunder_method(obj) and not self.dunders:
-            self._p(f"O: Failed on condition 1.1")
+        if obj is type:
             return False
 
-        # 1.4 -> 1.2
-        if is_private(obj) and not self.private:
-            self._p(f"O: Failed on condition 1.2")
-            return False
+        # Cheap checks on the name first, and the expensive `is_inspectable` last.
+        # The flags are read on every call, since they may be changed after construction
+        if name is None:
+            name = obj.__name__
 
-        # 1.2 -> 1.3
-        if obj is type:
-            self._p(f"O: Failed on condition 1.3")
+        if name in self._ignored_names:
             return False
 
-        # 1.1 -> 1.4
-        if name in self._ignored_names:
-            self._p(f"O: Failed on condition 1.4")
+        if not self.dunders and _is_dunder_name(name):
             return False
 
-        # 1.6 -> 1.5
-        if not is_inspectable(obj):
-            self._p(f"O: Failed on condition 1.5")
+        if not self.private and _is_private_name(name):
             return False
 
-        # 1.3 -> 1.6
-        if is_test(obj) and not self.tests:
-            self._p(f"O: Failed on condition 1.6")
+        if not self.tests and _is_test_name(name):
             return False
 
-        return True
+        return is_inspectable(obj)
 
-    def _search(self, *, obj, stack=None, final_node_at_depth=None):
+    def _search(self, *, obj, stack, final_node_at_depth):
         """
-        Missing docstring.
+        Yield (stack, final_node_at_depth) tuples for `obj` and its descendants.
+
+        The DFS is iterative, using a work stack of (object, depth, final) triples.
+        The lists `stack` (the ancestors of the current object) and
+        `final_node_at_depth` are buffers shared by the entire search, truncated
+        to the depth of every object popped from the work stack. Every yielded
+        value is a tuple snapshot of them, so consumers may store it without
+        copying.
         """
 
-        # =============================================================================
-        #         (1) BOUNDARY CONDITIONS
-        #         These conditions are triggered when the DFS reaches a leaf node in
-        #         the object tree, when the search has reached its desired depth or
-        #         at the root note of the object tree.
-        # =============================================================================
+        _ismodule = inspect.ismodule
+        _isclass = inspect.isclass
+
+        work = [(obj, 0, True)]
+        while work:
+            obj, depth, final = work.pop()
+            del stack[depth:]
+            del final_node_at_depth[depth:]
+            final_node_at_depth.append(final)
 
-        stack = stack or []
-        final_node_at_depth = final_node_at_depth or [True]
+            # =========================================================================
+            #         (1) BOUNDARY CONDITIONS
+            #         These conditions are triggered when the DFS reaches a leaf node
+            #         in the object tree, when the search has reached its desired
+            #         depth or at the root note of the object tree.
+            # =========================================================================
 
-        self._p(f"yield_data({obj}, stack={stack}), final_node_at_depth={final_node_at_depth}")
+            if depth > self.level + 1:
+                continue
 
-        if len(stack) > self.level + 1:
-            self._p(f"Max level reached. Aborting.")
-            return
+            yield (*stack, obj), tuple(final_node_at_depth)
 
-        assert len(stack + [obj]) == len(final_node_at_depth)
-        yield stack + [obj], final_node_at_depth
+            # If it's not a module/package or class, we don't bother getting children
+            if not (_ismodule(obj) or _isclass(obj)):
+                continue
 
-        # If it's not a module/package or class, we don't bother getting children
-        if not (inspect.ismodule(obj) or inspect.isclass(obj)):
-            return
+            # =========================================================================
+            #         (2) PUSH THE CHILD OBJECTS
+            #         Children are pushed in reverse order, so that the first child
+            #         is popped first. The final child is known before any of them
+            #         is visited, see `_children`.
+            # =========================================================================
+
+            stack.append(obj)
+            filtered = self._children(obj=obj)
+            work.extend((child_obj, depth + 1, num == 0) for num, (_, child_obj) in enumerate(reversed(filtered)))
+
+    def _children(self, *, obj):
+        """Return a list of (name, child_obj) for the children of `obj` to recurse on."""
+
+        # Bind frequently used functions to local names, avoiding repeated attribute
+        # lookups on the `inspect` module for every child object
+        _ismodule = inspect.ismodule
+        _isclass = inspect.isclass
 
         # =============================================================================
         #         (2) FILTER THE CHILD OBJECTS
@@ -290,55 +304,58 @@ class ObjectTraverser(PrintMixin):
         #         before it recurses on a, b or c.
         # =============================================================================
 
-        # The objects we will recurse on
-        generator1 = descend_from_package(
-            package=obj,
-            include_tests=self.tests,
+        # The objects we will recurse on. Only modules can descend to other modules
+        if _ismodule(obj):
+            generator1 = descend_from_package(
+                package=obj,
+                include_tests=self.tests,
+                include_private=self.private,
+                include_modules=self.modules,
+                include_subpackages=self.subpackages,
+            )
+        else:
+            generator1 = iter(())
+        generator2 = get_members(
+            obj,
             include_private=self.private,
-            include_modules=self.modules,
-            include_subpackages=self.subpackages,
+            include_dunders=self.dunders,
+            ignored_names=self._ignored_names,
         )
-        generator2 = inspect.getmembers(obj)
-
-        def unique_first(gen1, gen2):
-            """Chain generators, but only one unique name."""
-            # Using a list would be faster, but modules are not hashable, so O(n) lookup
-            seen_objects = []
-            seen_names = set()
-            for name, obj in itertools.chain(generator1, generator2):
-                # If it's not a module it's not a problem, since generator2 only yield modules
-                if not inspect.ismodule(obj):
-                    yield name, obj
-                    continue
 
-                try:
-                    if obj not in seen_objects:
-                        seen_objects.append(obj)
-                        seen_names.add(name)
-                        yield name, obj
-
-                # The comparison operation has been overwritten. Fall back to naming
-                # This happen for instance with pandas NaT (Not a Time)
-                except TypeError:
-                    if name not in seen_names:
-                        seen_objects.append(obj)
-                        seen_names.add(name)
-                        yield name, obj
-
-                except:
+        # Chain the generators into a dict of unique names. A module may be yielded by
+        # both generators under different names, e.g. `pkg.module` and `module`, so the
+        # first occurrence of every module is kept. Modules are compared by their ids,
+        # since comparison may be overwritten, e.g. for pandas NaT (Not a Time)
+        children = {}
+        seen_modules = set()
+        for name, child_obj in itertools.chain(generator1, generator2):
+            if _ismodule(child_obj):
+                if id(child_obj) in seen_modules:
                     continue
+                seen_modules.add(id(child_obj))
+
+            if name not in children:
+                children[name] = child_obj
 
-        generator = unique_first(generator1, generator2)
+        # Properties of `obj` used when deciding whether to recurse to each child
+        context = _parent_context(obj)
+
+        # A class found in a module must be defined in that module, or below it.
+        # The dot prevents `pkg` from matching classes defined in `pkgother`
+        parent_prefix = obj.__name__ + "." if context.is_module else None
 
         # Iterate through children
         filtered = []
-        for name, child_obj in sorted(generator, key=self.sort_key):
-            self._p(f"Looking at {name}, {type(child_obj)}")
+        for name, child_obj in sorted(children.items(), key=self.sort_key):
+            # Objects without a `__name__` are checked using the attribute name
+            child_name = getattr(child_obj, "__name__", None)
 
-            try:
-                getattr(child_obj, "__name__")
+            # Check if we should skip the object by virtue of its properties
+            if not self.recurse_to_object(obj=child_obj, name=name if child_name is None else child_name):
+                continue
 
-            except AttributeError:
+            # The printers need a `__name__`, so it is set on the objects that are kept
+            if child_name is None:
                 try:
                     setattr(child_obj, "__name__", name)
 
@@ -347,31 +364,20 @@ class ObjectTraverser(PrintMixin):
                     # TODO: Figure out how to deal with properties
                     continue
 
-            assert hasattr(child_obj, "__name__")
-
-            # Check if we should skip the object by virtue of its properties
-            if not self.recurse_to_object(obj=child_obj):
-                continue
+            # Cheap name based version of condition 3.1 in `recurse_to_child_object`
+            if parent_prefix is not None and _isclass(child_obj):
+                child_module = _getmodule(child_obj)
+                if child_module is None or not (child_module.__name__ + ".").startswith(parent_prefix):
+                    continue
 
             # Check if we should skip the child object by virtue of its relationship
             # to the parent object
-            if not self.recurse_to_child_object(obj=obj, child_obj=child_obj):
+            if not self.recurse_to_child_object(obj=obj, child_obj=child_obj, context=context):
                 continue
 
             filtered.append((name, child_obj))
 
-        # =============================================================================
-        #         (3) RECURSE ON CHILD OBJECTS
-        #         For every child object that we're interested in, recurse.
-        # =============================================================================
-
-        for num, (name, child_obj) in enumerate(filtered, 1):
-            last = True if len(filtered) == num else False
-            yield from self._search(
-                obj=child_obj,
-                stack=stack.copy() + [obj],
-                final_node_at_depth=final_node_at_depth.copy() + [last],
-            )
+        return filtered
 
 
 # =============================================================================
@@ -379,82 +385,230 @@ class ObjectTraverser(PrintMixin):
 # =============================================================================
 
 
+@cache_by_id()
 def is_inspectable(obj) -> bool:
     """An object is inspectable if it returns True for any of the inspect.is.. functions."""
-    is_inspectable_by_func = any((func(obj) for func in INSPECTION_FUNCS))
-    return is_inspectable_by_func or isinstance(obj, functools.partial)
+    # A single isinstance check for partials is cheaper than the sweep over the rest
+    return (
+        any(func(obj) for func in _FAST_INSPECT)
+        or isinstance(obj, functools.partial)
+        or any(func(obj) for func in _REST_INSPECT)
+    )
 
 
-def is_propersubpackage(package_a, package_b) -> bool:
+@cache_by_id()
+def _getfile(obj):
+    """Cached version of `inspect.getfile`, returning None for built-in objects."""
+    try:
+        return inspect.getfile(obj)
+    except TypeError:
+        return None
+
+
+@cache_by_id()
+def _splitfile(obj):
+    """Cached (path, file) split of the file of an object, or (None, None) for built-ins."""
+    file = _getfile(obj)
+    if file is None:
+        return None, None
+    return os.path.split(file)
+
+
+@cache_by_id()
+def _getmodule(obj):
+    """Cached version of `inspect.getmodule`."""
+    return inspect.getmodule(obj)
+
+
+# Properties of a parent object, computed once before its children are filtered
+_ParentContext = collections.namedtuple(
+    "_ParentContext",
+    ["is_module", "is_class", "is_package", "package", "package_prefix", "file", "path"],
+)
+
+
+def _parent_context(obj) -> _ParentContext:
+    """Compute the properties of a parent object used by `recurse_to_child_object`."""
+    path, _ = _splitfile(obj)
+    package = getattr(obj, "__package__", None)
+    is_module = inspect.ismodule(obj)
+    return _ParentContext(
+        is_module=is_module,
+        is_class=inspect.isclass(obj),
+        is_package=is_module and is_package(obj),
+        package=package,
+        package_prefix=_package_prefix(package),
+        file=_getfile(obj),
+        path=path,
+    )
+
+
+def _package_prefix(package) -> str:
+    """The prefix of every package inside `package`, i.e. 'pkg.' for 'pkg'.
+
+    Top level modules have the empty package, the root of all packages.
+
+    >>> _package_prefix("pkg.sub"), _package_prefix("")
+    ('pkg.sub.', '')
     """
-    Is A a proper subpackage or submodule of B?
+    return package + "." if package else ""
+
+
+# Relations between two packages, as returned by `_package_relation`
+_UNRELATED, _SAME_PACKAGE, _PROPER_SUBPACKAGE = 0, 1, 2
+
+
+def _package_relation(package_a, package_b) -> int:
     """
-    try:
-        path_a, _ = os.path.split(inspect.getfile(package_a))
-        path_b, _ = os.path.split(inspect.getfile(package_b))
+    Is A unrelated to B, at the same level as B, or a proper subpackage or submodule of B?
 
-    except TypeError:
+    Answers both `is_subpackage` and `is_propersubpackage` with a single lookup of the paths.
+    """
+    path_a, _ = _splitfile(package_a)
+    path_b, _ = _splitfile(package_b)
+
+    if path_a is None or path_b is None:
         # Is a built-in module
-        return False
+        # For instance: is_subpackage(builtins, builtins) should return True
+        return _SAME_PACKAGE if package_a == package_b else _UNRELATED
+
+    if path_b == path_a:
+        return _SAME_PACKAGE
+
+    return _PROPER_SUBPACKAGE if _is_proper_subpath(path_a, path_b) else _UNRELATED
+
+
+def _is_proper_subpath(path_a: str, path_b: str) -> bool:
+    """Is the directory A below the directory B?
+
+    A prefix check with a separator, so that `/pkg` does not contain `/pkgother`.
+    A directory ending with a separator, such as the root `/`, has it added once.
+
+    >>> _is_proper_subpath(os.path.join(os.sep, "pkg"), os.sep)
+    True
+    """
+    prefix = path_b if path_b.endswith(os.sep) else path_b + os.sep
+    return path_a.startswith(prefix)
+
 
-    return (path_b in path_a) and not (path_b == path_a)
+def is_propersubpackage(package_a, package_b) -> bool:
+    """
+    Is A a proper subpackage or submodule of B?
+    """
+    return _package_relation(package_a, package_b) == _PROPER_SUBPACKAGE
 
 
 def is_subpackage(package_a, package_b) -> bool:
     """
     Is A a subpackage or submodule of B?
     """
-    try:
-        path_a, _ = os.path.split(inspect.getfile(package_a))
-        path_b, _ = os.path.split(inspect.getfile(package_b))
+    return _package_relation(package_a, package_b) != _UNRELATED
 
-    except TypeError:
-        # Is a built-in module
-        # For instance: is_subpackage(builtins, builtins) should return True
-        if package_a == package_b:
-            return True
 
-        return False
+def get_members(obj, *, include_private=False, include_dunders=False, ignored_names=()):
+    """Yield (name, value) for the attributes of an object, like `inspect.getmembers`.
 
-    return path_b in path_a
+    Names that would be filtered out anyway are skipped before `getattr` is called,
+    since getting an attribute may be expensive, e.g. for properties. As in
+    `inspect.getmembers`, the `DynamicClassAttribute` names of the bases of a class
+    are included, e.g. `name` and `value` of an `enum.Enum`, and an attribute
+    raising AttributeError is looked up in the `__dict__` of the classes in the MRO.
+    """
+    names = dir(obj)
+    if inspect.isclass(obj):
+        mro = (obj,) + inspect.getmro(obj)
+        try:
+            for base in obj.__bases__:
+                for name, value in base.__dict__.items():
+                    if isinstance(value, types.DynamicClassAttribute):
+                        names.append(name)
+        except AttributeError:
+            pass
+    else:
+        mro = ()
+
+    # The sort is stable, so a name added above comes after the same name from `dir`
+    processed = set()
+    for name in sorted(names):
+        if name in ignored_names:
+            continue
 
+        if _is_dunder_name(name):
+            if not include_dunders:
+                continue
 
-def is_dunder_method(obj) -> bool:
-    """Is the method a dunder (double underscore), i.e. __add__(self, other)?"""
-    assert hasattr(obj, "__name__")
+        elif not include_private and _is_private_name(name):
+            continue
 
-    obj_name = obj.__name__
+        # Some descriptors raise on `__get__`, so fall back to looking in `__dict__`
+        try:
+            value = getattr(obj, name)
+            if name in processed:
+                raise AttributeError
+        except AttributeError:
+            for base in mro:
+                if name in base.__dict__:
+                    value = base.__dict__[name]
+                    break
+            else:
+                # A missing slot member or a buggy `__dir__`
+                continue
 
-    return obj_name.endswith("__") and obj_name.startswith("__")
+        processed.add(name)
+        yield name, value
 
 
-def is_private(obj) -> bool:
-    """Is the object private, i.e. _func(x)?"""
-    assert hasattr(obj, "__name__")
+def is_dunder_method(obj) -> bool:
+    """Is the method a dunder (double underscore), i.e. __add__(self, other)?"""
+    name = getattr(obj, "__name__", None)
+    return name is not None and _is_dunder_name(name)
 
-    obj_name = obj.__name__
-    typical_private = obj_name.startswith("_") and obj_name[1] != "_"
-    private_subpackage = "._" in obj_name
 
-    return typical_private or private_subpackage
+def is_private(obj) -> bool:
+    """Is the object private, i.e. _func(x)?"""
+    name = getattr(obj, "__name__", None)
+    return name is not None and _is_private_name(name)
 
 
 def is_test(obj) -> bool:
     """Is the object a test, i.e. test_func()?"""
-    assert hasattr(obj, "__name__")
+    name = getattr(obj, "__name__", None)
+    return name is not None and _is_test_name(name)
+
+
+# Prefixes of test names, checked in a single `str.startswith` call
+_TEST_PREFIXES = ("test", "_test", "__test")
+
+
+def _is_dunder_name(name: str) -> bool:
+    # Character comparisons, most names fail on the first one
+    return len(name) >= 4 and name[0] == "_" and name[1] == "_" and name[-1] == "_" and name[-2] == "_"
 
-    obj_name = obj.__name__.lower()
-    patterns = ("test", "_test", "__test")
 
-    return any(obj_name.startswith(pattern) for pattern in patterns)
+def _is_private_name(name: str) -> bool:
+    # The slice is empty for the name "_", which is private. The substring scan for
+    # a private subpackage, e.g. "pkg._sub", only runs if the first check fails
+    return (name[:1] == "_" and name[1:2] != "_") or "._" in name
 
 
+def _is_test_name(name: str) -> bool:
+    return name.lower().startswith(_TEST_PREFIXES)
+
+
+@cache_by_id()
 def is_package(obj) -> bool:
-    """Does the object file end with '__init__.py'?"""
-    if not hasattr(obj, "__file__"):
-        return False
+    """Is the object a package, i.e. a module with submodules?
+
+    The import system marks packages by `submodule_search_locations` in the spec,
+    which also covers namespace packages and packages imported from bytecode or zips.
+    """
+    spec = getattr(obj, "__spec__", None)
+    if spec is not None:
+        return spec.submodule_search_locations is not None
 
-    return obj.__file__.endswith("__init__.py")
+    # Modules without a spec, e.g. created with `types.ModuleType`
+    file = getattr(obj, "__file__", None)
+    return file is not None and file.endswith("__init__.py")
 
 
 def descend_from_package(
@@ -469,62 +623,54 @@ def descend_from_package(
 
     Yields a tuple of (object, object_name) one level down.
     """
-    if not inspect.ismodule(package):
+    # Nothing is imported if neither modules nor subpackages are wanted
+    if not inspect.ismodule(package) or not (include_modules or include_subpackages):
         return None
 
+    yield from _descend(package, include_tests, include_private, include_modules, include_subpackages)
+
+
+@cache_by_id(maxsize=512)
+def _descend(package, include_tests, include_private, include_modules, include_subpackages):
+    """Import the wanted modules and subpackages one level down from a package, returning
+    a tuple of (object_name, object). Cached, so every module is imported and listed once."""
     try:
         path, _ = os.path.split(inspect.getfile(package))
 
     except TypeError:
         # Is a built-in module
-        return None
+        return ()
 
     prefix = package.__name__ + "."
 
     generator = pkgutil.iter_modules(path=[path], prefix=prefix)
 
+    descended = []
     for importer, object_name, ispkg in generator:
-        ismodule = not ispkg
-
         # Covers names such as "test", "tests", "testing", ...
-        if ".test" in object_name.lower() and not include_tests:
+        if not include_tests and ".test" in object_name.lower():
             continue
 
-        if "._" in object_name.lower() and not include_private:
+        # Lowercasing does not change "._", so the name is checked as is
+        if not include_private and "._" in object_name:
+            continue
+
+        # Only modules that will be yielded are imported
+        if not (include_subpackages if ispkg else include_modules):
             continue
 
         try:
             obj = importlib.import_module(object_name)
 
-        except ModuleNotFoundError:
-            # TODO: Replace this with logging
-            # print(f"Could not import {object_name}. Error: {error}")
-            return
-
-        except ImportError:
-            # print(f"Could not import {object_name}. Error: {error}")
-            return
-
-        # File "/home/tommy/anaconda3/envs/treedoc/lib/python3.7/ctypes/wintypes.py", line 20, in <module>
-        except ValueError:
-            # print(f"Could not import {object_name}. Error: {error}")
-            return
-
-        # File "/home/tommy/anaconda3/envs/treedoc/lib/python3.7/ctypes/wintypes.py", line 20, in <module>
-        except LookupError:
-            # print(f"Could not import {object_name}. Error: {error}")
-            return
-
-        # File "/home/tommy/anaconda3/envs/treedoc/lib/python3.7/site-packages/numpy/ma/version.py", line 12, in <module>
-        except AttributeError:
-            # print(f"Could not import {object_name}. Error: {error}")
-            return
+        # ValueError and LookupError are raised by e.g. `ctypes.wintypes` outside of
+        # Windows, and AttributeError by e.g. `numpy.ma.version`
+        except (ImportError, ValueError, LookupError, AttributeError) as error:
+            logger.debug("Could not import %s: %r", object_name, error)
+            break
 
-        if include_subpackages and ispkg:
-            yield object_name, obj
+        descended.append((object_name, obj))
 
-        if include_modules and ismodule:
-            yield object_name, obj
+    return tuple(descended)
 
 
 if __name__ == "__main__":
@@ -4,20 +4,113 @@
 General utilities for treedoc.
 """
 
-import collections
+import functools
+import inspect
 import os
 import typing
 
+# The inspect.is.. predicates by name, sorted, computed once at import. Functions
+# merely imported into `inspect`, i.e. `keyword.iskeyword`, are excluded
+INSPECT_PREDICATES: typing.Dict[str, typing.Callable[[typing.Any], bool]] = {
+    name: func
+    for (name, func) in sorted(vars(inspect).items())
+    if name.startswith("is") and inspect.isfunction(func) and func.__module__ == inspect.__name__
+}
+
 
 class PrintMixin:
-    """Adds a __repr__ method to a class."""
+    """Adds a __repr__ method to a class.
+
+    The representation is built from the instance `__dict__` and from any `__slots__`
+    of the class and its bases, so subclasses with or without slots are supported.
+    """
 
     # Could've used dataclasses, but they were introduced in Python 3.8
 
+    # No instance attributes of its own, so a mixin does not add a `__dict__`
+    __slots__ = ()
+
     def __repr__(self) -> str:
-        """Returns a printable representation of an object, e.g. 'ClassName(a=2, b=3)'."""
-        args = ["{}={}".format(k, v) for k, v in self.__dict__.items()]
-        return type(self).__name__ + "({})".format(", ".join(args))
+        """Returns a printable representation of an object, e.g. 'ClassName(a=2, b=3)'.
+
+        Unset slots are left out."""
+        attributes = dict(getattr(self, "__dict__", {}))
+        for name in _slot_names(type(self)):
+            try:
+                attributes[name] = getattr(self, name)
+            except AttributeError:
+                continue
+
+        args = ", ".join(f"{k}={v!r}" for k, v in attributes.items())
+        return f"{type(self).__name__}({args})"
+
+
+def cache_by_id(maxsize=4096, *, depends_on=None):
+    """Cache a function of an object, keyed by the identity of the object.
+
+    This is the cache used for functions of the objects treedoc traverses. Objects
+    are keyed by `id` rather than by equality, since they may be unhashable, e.g. a
+    module `__spec__`, or compare equal to other objects, e.g. `1 == True` or pandas
+    NaT. Every entry holds on to its object, so the id is not reused by another
+    object while it is cached. Further arguments are part of the key, and must be
+    hashable. Exceptions are not cached, and the oldest entry is evicted when full.
+
+    If given, `depends_on(obj)` is stored with every entry, and the entry is only
+    used while it returns the same object, e.g. the `__doc__` of the object.
+
+    >>> @cache_by_id(maxsize=2)
+    ... def show(obj):
+    ...     return repr(obj)
+    >>> show([1, 2, 3])
+    '[1, 2, 3]'
+    >>> show(1), show(True)
+    ('1', 'True')
+    """
+
+    def decorator(function):
+        cache: typing.Dict[tuple, tuple] = {}
+
+        @functools.wraps(function)
+        def wrapped(obj, *args, **kwargs):
+            key = (id(obj), args, tuple(kwargs.items()))
+            token = None if depends_on is None else depends_on(obj)
+            cached = cache.get(key)
+            if cached is not None and cached[1] is token:
+                return cached[2]
+
+            result = function(obj, *args, **kwargs)
+
+            # Evict the oldest entry, dicts are ordered by insertion
+            if key not in cache and len(cache) >= maxsize:
+                del cache[next(iter(cache))]
+            cache[key] = (obj, token, result)
+
+            return result
+
+        wrapped.cache_clear = cache.clear  # type: ignore
+        return wrapped
+
+    return decorator
+
+
+@cache_by_id()
+def _slot_names(cls) -> typing.Tuple[str, ...]:
+    """The names of the slots of a class and its bases, in definition order from the base.
+
+    >>> class Point:
+    ...     __slots__ = ("x", "y")
+    >>> class Point3D(Point):
+    ...     __slots__ = "z"
+    >>> _slot_names(Point3D)
+    ('x', 'y', 'z')
+    """
+    names: typing.List[str] = []
+    for klass in reversed(cls.__mro__):
+        slots = klass.__dict__.get("__slots__", ())
+        for name in [slots] if isinstance(slots, str) else slots:
+            if name not in ("__dict__", "__weakref__") and name not in names:
+                names.append(name)
+    return tuple(names)
 
 
 _marker = object()
@@ -43,9 +136,13 @@ class Peekable:
     'hi'
     """
 
+    # The lookahead is at most one item, so a single slot replaces a deque
+    __slots__ = ("_it", "_has_next", "_next")
+
     def __init__(self, iterable):
         self._it = iter(iterable)
-        self._cache = collections.deque()
+        self._has_next = False
+        self._next = None
 
     def __iter__(self):
         return self
@@ -57,24 +154,28 @@ class Peekable:
             return False
         return True
 
-    def peek(self, default=_marker):
+    def peek(self, default=_marker, _marker=_marker):
         """Return item that will be returned from ``next()``.
 
         Returns ``default`` if iterator is exhausted. If ``default`` is not
         provided, raise ``StopIteration``.
         """
-        if not self._cache:
+        # `_marker` is bound as a default argument, a local instead of a global lookup
+        if not self._has_next:
             try:
-                self._cache.append(next(self._it))
+                self._next = next(self._it)
             except StopIteration:
                 if default is _marker:
                     raise
                 return default
-        return self._cache[0]
+            self._has_next = True
+        return self._next
 
     def __next__(self):
-        if self._cache:
-            return self._cache.popleft()
+        if self._has_next:
+            self._has_next = False
+            item, self._next = self._next, None
+            return item
 
         return next(self._it)
 
@@ -84,12 +185,17 @@ def get_terminal_size(fallback=(128, 24)) -> typing.Tuple[int, int]:
 
     See http://granitosaurus.rocks/getting-terminal-size.html
     """
-    for i in range(0, 3):
+    size = _terminal_size()
+    return fallback if size is None else size
+
+
+@functools.lru_cache(maxsize=None)
+def _terminal_size() -> typing.Optional[typing.Tuple[int, int]]:
+    """Query the terminal size once, trying stdout first since it's most often a terminal."""
+    for fd in (1, 2, 0):
         try:
-            columns, rows = os.get_terminal_size(i)
+            columns, rows = os.get_terminal_size(fd)
         except OSError:
             continue
-        break
-    else:  # set default if the loop completes which means all failed
-        columns, rows = fallback
-    return columns, rows
+        return columns, rows
+    return None
@@ -4,21 +4,69 @@
 Utility functions which are not in use.
 """
 
+import functools
 import inspect
-
-
+import types
+import typing
+
+from treedoc.utils import INSPECT_PREDICATES, cache_by_id
+
+# Pairs (name, func) of the inspect.is.. functions, sorted by name, e.g. ("class", inspect.isclass)
+_INSPECT_CLASSIFIERS = tuple((name[2:], func) for (name, func) in INSPECT_PREDICATES.items())
+
+# Predicates that are isinstance checks, so their answer depends on the type of the
+# object only. Others, e.g. `isabstract` or `isgeneratorfunction`, depend on the object
+_TYPE_CLASSIFIERS = (
+    ("asyncgen", types.AsyncGeneratorType),
+    ("builtin", types.BuiltinFunctionType),
+    ("class", type),
+    ("code", types.CodeType),
+    ("coroutine", types.CoroutineType),
+    ("frame", types.FrameType),
+    ("function", types.FunctionType),
+    ("generator", types.GeneratorType),
+    ("getsetdescriptor", types.GetSetDescriptorType),
+    ("memberdescriptor", types.MemberDescriptorType),
+    ("method", types.MethodType),
+    ("methodwrapper", types.MethodWrapperType),
+    ("module", types.ModuleType),
+    ("traceback", types.TracebackType),
+)
+_TYPE_ONLY_NAMES = frozenset(name for (name, _) in _TYPE_CLASSIFIERS)
+_INSTANCE_CLASSIFIERS = tuple((name, func) for (name, func) in _INSPECT_CLASSIFIERS if name not in _TYPE_ONLY_NAMES)
+
+
+@functools.lru_cache(maxsize=256)
+def _classify_type(obj_type) -> typing.List[str]:
+    """The names from `_TYPE_CLASSIFIERS` that hold for instances of `obj_type`."""
+    return [name for (name, cls) in _TYPE_CLASSIFIERS if issubclass(obj_type, cls)]
+
+
+@cache_by_id()
 def is_method(obj):
     """Whether an object is a method or not."""
     return inspect.ismethoddescriptor(obj) or inspect.ismethod(obj)
 
 
+@cache_by_id()
 def is_bound_method(obj):
     """Whether a method is bound to a class or not."""
-    condition1 = "." in obj.__qualname__
-    if not inspect.getfullargspec(obj).args:
+    # The cheap check on the name first
+    if "." not in obj.__qualname__:
+        return False
+
+    # Python functions and methods: the first positional argument is in the code object
+    code = getattr(obj, "__code__", None)
+    if code is not None:
+        return code.co_argcount > 0 and code.co_varnames[0] == "self"
+
+    # Built-ins and other callables without code, e.g. `list.append`
+    try:
+        args = inspect.getfullargspec(obj).args
+    except TypeError:
         return False
-    condition2 = inspect.getfullargspec(obj).args[0] == "self"
-    return condition1 and condition2
+
+    return bool(args) and args[0] == "self"
 
 
 def inspect_classify(obj):
@@ -62,18 +110,9 @@ def inspect_classify(obj):
 
         Numpy ufuncs not found.
     """
-    classes = list()
-
-    for function_name in sorted(dir(inspect)):
-        if not function_name.startswith("is"):
-            continue
-
-        function = getattr(inspect, function_name)
-
-        if function(obj):
-            classes.append(function_name[2:])
-
-    return classes
+    by_type = _classify_type(type(obj))
+    by_instance = [name for (name, func) in _INSTANCE_CLASSIFIERS if func(obj)]
+    return sorted(by_type + by_instance)
 
 
 if __name__ == "__main__":